@@ -5,6 +5,7 @@ This file configures the test environment and provides setup/teardown hooks.
 Placed under test/integration/features so Behave auto-discovers it.
 """
 
+import copy
 import os
 import sys
 import time
@@ -57,6 +58,12 @@ def before_all(context):
         print("   Valid modes: 'smoke' or 'hardware'")
         sys.exit(1)
 
+    # Read dome_config.json once per run; features and scenarios get deep
+    # copies because they adjust the testing section in place
+    from config import load_config
+
+    context.base_app_config = load_config()
+
     print("=" * 80 + "\n")
 
 
@@ -101,11 +108,8 @@ def before_feature(context, feature):
     context.scenarios_passed = 0
     context.scenarios_failed = 0
 
-    # Load configuration based on test mode
-    from config import load_config
-
-    # Load application config (this should always succeed with defaults)
-    context.app_config = load_config()
+    # Start from a fresh copy of the configuration loaded in before_all
+    context.app_config = copy.deepcopy(context.base_app_config)
 
     # Configure for hardware or smoke test mode
     if hasattr(context, "test_mode"):
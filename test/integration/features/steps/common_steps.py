@@ -6,6 +6,7 @@ hardware-specific steps (shutter, rotation, homing) belong in their own
 step modules to avoid ambiguous step registrations.
 """
 
+import copy
 import os
 import sys
 import time
@@ -21,8 +22,10 @@ from dome import Dome  # noqa: E402
 @given("the dome controller is initialized")
 def step_dome_controller_initialized(context):
     """Initialize the dome controller for testing."""
-    # Load a deterministic config for tests and force mock/smoke settings
-    config = load_config()
+    # Load a deterministic config for tests and force mock/smoke settings;
+    # reuse the copy parsed once in before_all instead of re-reading the file
+    base_config = getattr(context, "base_app_config", None)
+    config = copy.deepcopy(base_config) if base_config else load_config()
     config.setdefault("testing", {})
     config["testing"]["smoke_test"] = True
     # Provide a short smoke timeout to make shutter timing deterministic in tests
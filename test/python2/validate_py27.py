@@ -10,591 +10,681 @@ This replaces multiple scattered test files with a single comprehensive validati
 
 Usage:
     source venv_py27/bin/activate
-    python test/python2/validate_py27.py [--verbose] [--persistence-only]
+    python test/python2/validate_py27.py [--verbose] [--persistence-only] [--fail-fast]
+                                         [--cache]
+
+With --cache, a full run is skipped when the driver modules, INDI scripts,
+this suite and the interpreter are unchanged since the last passing run.
 """
 
+import contextlib
+import copy
+import functools
+import hashlib
+import importlib
+import json
 import os
-import subprocess
+import re
 import sys
-import tempfile
 
-# Add the Python 2.7 lib directory to the path
+try:
+    # Python 2.7: accepts the byte strings print() produces there
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+# Add the Python 2.7 lib directory to the path unless it is already importable
+# (e.g. via PYTHONPATH); normalised so the membership test matches
 script_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(
-    0, os.path.join(script_dir, "..", "..", "indi_driver", "python2", "lib")
+LIB_DIR = os.path.abspath(
+    os.path.join(script_dir, "..", "..", "indi_driver", "python2", "lib")
 )
+if LIB_DIR not in sys.path:
+    sys.path.insert(0, LIB_DIR)
 
+# INDI scripts checked by test_script_integration
+SCRIPTS_DIR = os.path.join(script_dir, "..", "..", "indi_driver", "python2", "scripts")
 
-class ValidationTests(object):
-    """Python 2.7 validation test suite"""
+# Digest of the last passing run, used by --cache
+_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "indi_k8055_validate_py27.json"
+)
 
-    def __init__(self, verbose=False):
-        self.verbose = verbose
-        self.passed = 0
-        self.failed = 0
-        self.temp_files = []
+# Status line prefixes, built once rather than re-parsed in every message
+_OK = "  ✓ "
+_FAIL = "  ❌ "
+_WARN = "  ⚠ "
+
+# Mock-mode configuration shared by the dome creation and persistence tests.
+# Dome only reads from its config, so the same dict is passed to every instance.
+_TEST_CONFIG = {
+    "pins": {
+        "encoder_a": 1,
+        "encoder_b": 2,
+        "home_switch": 3,
+        "shutter_upper_limit": 1,
+        "shutter_lower_limit": 2,
+        "dome_rotate": 1,
+        "dome_direction": 2,
+        "shutter_move": 3,
+        "shutter_direction": 4,
+    },
+    "calibration": {
+        "home_position": 0.0,
+        "ticks_to_degrees": 1.0,
+        "poll_interval": 0.1,
+    },
+    "hardware": {"mock_mode": True, "device_port": 0},
+    "testing": {"smoke_test": True, "smoke_test_timeout": 3.0},
+}
+
+# Home polling (C2) and encoder calibration (C3) settings on top of the shared
+# config, keeping the pin wiring those tests have always used; built once at
+# import since neither test mutates it
+_CALIBRATED_TEST_CONFIG = copy.deepcopy(_TEST_CONFIG)
+_CALIBRATED_TEST_CONFIG["pins"] = {
+    "encoder_a": 1,
+    "encoder_b": 5,
+    "home_switch": 2,
+    "dome_rotate": 1,
+    "dome_direction": 2,
+    "shutter_move": 5,
+    "shutter_direction": 6,
+}
+_CALIBRATED_TEST_CONFIG["calibration"].update(
+    {
+        "home_position": 225,
+        "ticks_to_degrees": 4.0,
+        "poll_interval": 0.5,
+        "home_poll_fast": 0.05,
+        "home_switch_debounce": 0.1,
+        "encoder_error_threshold": 50,
+        "encoder_calibration_timeout": 180.0,
+    }
+)
 
-    def log(self, message):
-        """Log message if verbose mode enabled"""
-        if self.verbose:
-            print("  {}".format(message))
+# Configs the tests build their shared mock domes from, by name
+_DOME_CONFIGS = {
+    "basic": _TEST_CONFIG,
+    "calibrated": _CALIBRATED_TEST_CONFIG,
+}
+
+# (position, is_turning) pairs round-tripped through the persistence file
+_PERSISTENCE_SCENARIOS = [(45.0, True), (0.0, False), (359.9, True)]
+
+# Scripts that should have full persistence (restore + save)
+_FULL_PERSISTENCE_SCRIPTS = (
+    "status.py",
+    "goto.py",
+    "park.py",
+    "move_cw.py",
+    "open.py",
+    "unpark.py",
+    "disconnect.py",
+    "abort.py",
+)
+# Scripts that only save state (connect establishes initial connection)
+_SAVE_ONLY_SCRIPTS = ("connect.py",)
+
+# (marker, description) pairs every INDI script must contain
+_FULL_PERSISTENCE_CHECKS = (
+    (b"from persistence import", "persistence import"),
+    (b"restore_state", "restore_state call"),
+    (b"save_state", "save_state call"),
+)
+_SAVE_ONLY_CHECKS = (
+    (b"from persistence import", "persistence import"),
+    (b"save_state", "save_state call"),
+)
+# Every marker above, so one regex sweep finds all of them in a script
+_MARKER_RE = re.compile(
+    b"|".join(
+        sorted(
+            set(
+                re.escape(marker)
+                for marker, _ in _FULL_PERSISTENCE_CHECKS + _SAVE_ONLY_CHECKS
+            )
+        )
+    )
+)
 
-    def test_imports(self):
-        """Test that all required modules can be imported"""
-        print("1. Testing module imports...")
+# (module, description) pairs the import test must be able to load
+_REQUIRED_MODULES = (
+    ("pyk8055_wrapper", "K8055 wrapper"),
+    ("dome", "Dome module"),
+    ("persistence", "Persistence module"),
+    ("config", "Config module"),
+)
 
-        # Test K8055 wrapper import
-        try:
-            import pyk8055_wrapper
 
-            self.log("K8055 wrapper imported successfully")
-            k8055_success = True
-        except Exception as e:
-            print("  ❌ K8055 wrapper import failed: {}".format(e))
-            k8055_success = False
+@contextlib.contextmanager
+def _temporary_directory():
+    """Yield a scratch directory and remove it afterwards
 
-        # Test dome module import
-        try:
-            import dome
+    Stand-in for tempfile.TemporaryDirectory, which Python 2.7 lacks.
+    """
+    import shutil
+    import tempfile
 
-            self.log("Dome module imported successfully")
-            dome_success = True
-        except Exception as e:
-            print("  ❌ Dome module import failed: {}".format(e))
-            dome_success = False
+    path = tempfile.mkdtemp()
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
 
-        # Test persistence module import
-        try:
-            import persistence
 
-            self.log("Persistence module imported successfully")
-            persistence_success = True
-        except Exception as e:
-            print("  ❌ Persistence module import failed: {}".format(e))
-            persistence_success = False
+def _validate_script(script_name, checks, existing):
+    """Return a problem description for a script, or None if it looks right
 
-        # Test config module import
-        try:
-            import config
+    ``existing`` is the set of names in SCRIPTS_DIR, listed once by the caller
+    so each script does not need its own stat call.
+    """
+    if script_name not in existing:
+        return "Script {} not found".format(script_name)
 
-            self.log("Config module imported successfully")
-            config_success = True
-        except Exception as e:
-            print("  ❌ Config module import failed: {}".format(e))
-            config_success = False
+    # Read raw bytes once; markers are ASCII so no decoding is needed
+    with open(os.path.join(SCRIPTS_DIR, script_name), "rb") as f:
+        content = f.read()
 
-        if k8055_success and dome_success and persistence_success and config_success:
-            print("  ✓ All module imports successful")
-            self.passed += 1
-            return True
-        else:
-            print("  ❌ Some module imports failed")
-            self.failed += 1
-            return False
+    found = set(_MARKER_RE.findall(content))
+    missing = next((desc for marker, desc in checks if marker not in found), None)
+    if missing is not None:
+        return "Script {} missing {}".format(script_name, missing)
+    return None
 
-    def test_dome_creation(self):
-        """Test dome object creation with mock configuration"""
-        print("2. Testing dome object creation...")
 
-        try:
-            from dome import Dome
+def _require_keys(mapping, required_keys, label):
+    """Raise listing every required key missing from a diagnostics dict"""
+    missing = set(required_keys) - set(mapping)
+    if missing:
+        raise Exception("Missing {} keys: {}".format(label, sorted(missing)))
 
-            # Create test config
-            config = {
-                "pins": {
-                    "encoder_a": 1,
-                    "encoder_b": 2,
-                    "home_switch": 3,
-                    "shutter_upper_limit": 1,
-                    "shutter_lower_limit": 2,
-                    "dome_rotate": 1,
-                    "dome_direction": 2,
-                    "shutter_move": 3,
-                    "shutter_direction": 4,
-                },
-                "calibration": {
-                    "home_position": 0.0,
-                    "ticks_to_degrees": 1.0,
-                    "poll_interval": 0.1,
-                },
-                "hardware": {"mock_mode": True, "device_port": 0},
-                "testing": {"smoke_test": True, "smoke_test_timeout": 3.0},
-            }
-
-            # Create dome object
-            dome = Dome(config)
-            self.log("Dome object created successfully")
-
-            # Test basic operations
-            position = dome.get_pos()
-            self.log("Position read: {:.1f} degrees".format(position))
-
-            # Test state attributes
-            self.log("Home state: {}".format(dome.is_home))
-            self.log("Turning state: {}".format(dome.is_turning))
-
-            print("  ✓ Dome creation and basic operations successful")
+
+def _counted(failure_label):
+    """Decorate a test method so it updates the pass/fail counters
+
+    The test signals failure by raising; the wrapper reports the error,
+    increments the matching counter and returns True/False.
+    """
+
+    def decorator(test):
+        @functools.wraps(test)
+        def wrapper(self):
+            try:
+                test(self)
+            except Exception as e:
+                self.report(_FAIL, "{}: {}".format(failure_label, e))
+                self.failed += 1
+                return False
             self.passed += 1
             return True
 
-        except Exception as e:
-            print("  ❌ Dome creation failed: {}".format(e))
-            self.failed += 1
-            return False
+        return wrapper
 
-    def test_persistence_functionality(self):
-        """Test persistence save/restore functionality"""
-        print("3. Testing persistence functionality...")
+    return decorator
 
-        try:
-            from dome import Dome
-            from persistence import DomePersistence
 
-            # Create temporary state file
-            temp_dir = tempfile.mkdtemp()
-            state_file = os.path.join(temp_dir, "test_state.json")
-            self.temp_files.append(state_file)
-
-            persistence = DomePersistence(state_file)
-
-            # Create test config
-            config = {
-                "pins": {
-                    "encoder_a": 1,
-                    "encoder_b": 2,
-                    "home_switch": 3,
-                    "shutter_upper_limit": 1,
-                    "shutter_lower_limit": 2,
-                    "dome_rotate": 1,
-                    "dome_direction": 2,
-                    "shutter_move": 3,
-                    "shutter_direction": 4,
-                },
-                "calibration": {
-                    "home_position": 0.0,
-                    "ticks_to_degrees": 1.0,
-                    "poll_interval": 0.1,
-                },
-                "hardware": {"mock_mode": True, "device_port": 0},
-                "testing": {"smoke_test": True, "smoke_test_timeout": 3.0},
-            }
-
-            # Test save/restore cycle
-            dome1 = Dome(config)
-            dome1.position = 45.0
-            dome1.is_turning = True
-            # Connection state should be True after Dome creation
-
-            success = persistence.save_dome_state(dome1, "test")
-            if not success:
-                raise Exception("Failed to save state")
-
-            dome2 = Dome(config)
-            success = persistence.restore_dome_state(dome2)
-            if not success:
-                raise Exception("Failed to restore state")
-
-            if dome2.position != 45.0:
-                raise Exception(
-                    "Position not restored correctly: {} != 45.0".format(dome2.position)
-                )
+class ValidationTests(object):
+    """Python 2.7 validation test suite"""
 
-            if not dome2.is_turning:
-                raise Exception("Turning state not restored correctly")
+    __slots__ = (
+        "verbose",
+        "fail_fast",
+        "passed",
+        "failed",
+        "_Dome",
+        "_DomePersistence",
+        "_domes",
+    )
+
+    def __init__(self, verbose=False, fail_fast=False):
+        self.verbose = verbose
+        self.fail_fast = fail_fast
+        self.passed = 0
+        self.failed = 0
+        self._Dome = None
+        self._DomePersistence = None
+        self._domes = {}
 
-            # Check that connection state is tracked
-            try:
-                device_connected = getattr(dome2.dome.k8055_device, "is_open", False)
-                if self.verbose:
-                    print("  Connection state restored: {}".format(device_connected))
-            except (AttributeError, TypeError):
-                if self.verbose:
-                    print(
-                        "  Connection state not accessible (acceptable for mock mode)"
-                    )
+    def log(self, message):
+        """Log message if verbose mode enabled"""
+        if self.verbose:
+            self.report("  ", message)
 
-            self.log("State saved and restored successfully")
-            self.log("Position: {} -> {}".format(dome1.position, dome2.position))
-            self.log("Turning: {} -> {}".format(dome1.is_turning, dome2.is_turning))
+    def report(self, prefix, message):
+        """Write a status line in one call, bypassing print's argument handling"""
+        sys.stdout.write(prefix + message + "\n")
 
-            print("  ✓ Persistence functionality working correctly")
-            self.passed += 1
-            return True
+    @_counted("Some module imports failed")
+    def test_imports(self):
+        """Test that all required modules can be imported"""
+        print("1. Testing module imports...")
 
-        except Exception as e:
-            print("  ❌ Persistence test failed: {}".format(e))
-            self.failed += 1
-            return False
+        failed_imports = []
+        for module_name, description in _REQUIRED_MODULES:
+            try:
+                importlib.import_module(module_name)
+                self.log("{} imported successfully".format(description))
+            except Exception as e:
+                self.report(_FAIL, "{} import failed: {}".format(description, e))
+                failed_imports.append(module_name)
 
-    def test_script_integration(self):
-        """Test that INDI scripts have persistence integration"""
-        print("4. Testing INDI script integration...")
+        if failed_imports:
+            raise Exception(", ".join(failed_imports))
 
-        scripts_dir = os.path.join(
-            script_dir, "..", "..", "indi_driver", "python2", "scripts"
-        )
-        # Scripts that should have full persistence (restore + save)
-        full_persistence_scripts = [
-            "status.py",
-            "goto.py",
-            "park.py",
-            "move_cw.py",
-            "open.py",
-            "unpark.py",
-            "disconnect.py",
-            "abort.py",
-        ]
-        # Scripts that only save state (connect establishes initial connection)
-        save_only_scripts = ["connect.py"]
+        self._ensure_modules()
+        self.report(_OK, "All module imports successful")
 
-        try:
-            # Test full persistence scripts
-            for script_name in full_persistence_scripts:
-                script_path = os.path.join(scripts_dir, script_name)
+    @_counted("Dome creation failed")
+    def test_dome_creation(self):
+        """Test dome object creation with mock configuration"""
+        print("2. Testing dome object creation...")
 
-                if not os.path.exists(script_path):
-                    raise Exception("Script {} not found".format(script_name))
+        # Create dome object
+        dome = self.shared_dome()
+        self.log("Dome object created successfully")
 
-                # Check that script contains persistence imports
-                with open(script_path, "r") as f:
-                    content = f.read()
+        # Test basic operations
+        position = dome.get_pos()
+        self.log("Position read: {:.1f} degrees".format(position))
 
-                if "from persistence import" not in content:
-                    raise Exception(
-                        "Script {} missing persistence import".format(script_name)
-                    )
+        # Test state attributes
+        self.log("Home state: {}".format(dome.is_home))
+        self.log("Turning state: {}".format(dome.is_turning))
 
-                if "restore_state" not in content:
-                    raise Exception(
-                        "Script {} missing restore_state call".format(script_name)
-                    )
+        self.report(_OK, "Dome creation and basic operations successful")
 
-                if "save_state" not in content:
-                    raise Exception(
-                        "Script {} missing save_state call".format(script_name)
-                    )
+    def _ensure_modules(self):
+        """Import the driver classes on first use and keep them for later tests"""
+        if self._Dome is None:
+            from dome import Dome
+            from persistence import DomePersistence
 
-                self.log("Script {} has persistence integration".format(script_name))
+            self._Dome = Dome
+            self._DomePersistence = DomePersistence
+
+    def shared_dome(self, name="basic"):
+        """Return the mock dome for a named config, creating it on first use
+
+        name is a key of _DOME_CONFIGS; tests asking for the same name share
+        one instance for the whole run.
+        """
+        dome = self._domes.get(name)
+        if dome is None:
+            self._ensure_modules()
+            dome = self._domes[name] = self._Dome(_DOME_CONFIGS[name])
+        return dome
+
+    def _roundtrip(self, persistence, dome, position, turning):
+        """Save the given state, clobber it in memory, then restore it
+
+        Returns:
+            tuple: (position, is_turning) as seen on the dome after restore
+        """
+        dome.position = position
+        dome.is_turning = turning
+        if not persistence.save_dome_state(dome, "test"):
+            raise Exception("Failed to save state")
+
+        # Overwrite the in-memory state so the restore has to bring it back
+        dome.position = (position + 180.0) % 360.0
+        dome.is_turning = not turning
+        if not persistence.restore_dome_state(dome):
+            raise Exception("Failed to restore state")
+
+        return dome.position, dome.is_turning
+
+    @_counted("Persistence test failed")
+    def test_persistence_functionality(self):
+        """Test persistence save/restore functionality"""
+        print("3. Testing persistence functionality...")
 
-            # Test save-only scripts
-            for script_name in save_only_scripts:
-                script_path = os.path.join(scripts_dir, script_name)
+        # A dome of its own: the round trips leave position and turning state
+        # behind, which must not leak into the tests sharing the basic dome
+        self._ensure_modules()
+        dome = self._Dome(_TEST_CONFIG)
 
-                if not os.path.exists(script_path):
-                    raise Exception("Script {} not found".format(script_name))
+        # The state file lives in a directory that is removed on exit
+        with _temporary_directory() as temp_dir:
+            state_file = os.path.join(temp_dir, "test_state.json")
+            persistence = self._DomePersistence(state_file)
 
-                # Check that script contains persistence imports
-                with open(script_path, "r") as f:
-                    content = f.read()
+            # Run every save/restore scenario against a single dome instance
+            for position, turning in _PERSISTENCE_SCENARIOS:
+                restored_pos, restored_turning = self._roundtrip(
+                    persistence, dome, position, turning
+                )
 
-                if "from persistence import" not in content:
+                if restored_pos != position:
                     raise Exception(
-                        "Script {} missing persistence import".format(script_name)
+                        "Position not restored correctly: {} != {}".format(
+                            restored_pos, position
+                        )
                     )
 
-                if "save_state" not in content:
-                    raise Exception(
-                        "Script {} missing save_state call".format(script_name)
-                    )
+                if restored_turning != turning:
+                    raise Exception("Turning state not restored correctly")
 
-                self.log(
-                    "Script {} has save-only persistence integration".format(
-                        script_name
-                    )
-                )
+                self.log("Position: {} -> {}".format(position, restored_pos))
+                self.log("Turning: {} -> {}".format(turning, restored_turning))
 
-            print("  ✓ All scripts have persistence integration")
-            self.passed += 1
-            return True
+        # Check that connection state is tracked
+        try:
+            device_connected = getattr(dome.dome.k8055_device, "is_open", False)
+            if self.verbose:
+                print("  Connection state restored: {}".format(device_connected))
+        except (AttributeError, TypeError):
+            if self.verbose:
+                print("  Connection state not accessible (acceptable for mock mode)")
 
-        except Exception as e:
-            print("  ❌ Script integration test failed: {}".format(e))
-            self.failed += 1
-            return False
+        self.log("State saved and restored successfully")
 
-    def test_python27_compatibility(self):
-        """Test Python 2.7 specific compatibility"""
-        print("5. Testing Python 2.7 compatibility...")
+        self.report(_OK, "Persistence functionality working correctly")
 
-        try:
-            # Check Python version
-            if sys.version_info[0] != 2 or sys.version_info[1] != 7:
-                print(
-                    "  ⚠ Warning: Not running on Python 2.7 ({}.{})".format(
-                        sys.version_info[0], sys.version_info[1]
-                    )
-                )
+    @_counted("Script integration test failed")
+    def test_script_integration(self):
+        """Test that INDI scripts have persistence integration"""
+        print("4. Testing INDI script integration...")
 
-            # Test string formatting (no f-strings)
-            test_str = "Position: {:.2f} degrees".format(45.5)
-            if "45.50" not in test_str:
-                raise Exception("String formatting test failed")
+        jobs = [
+            (name, _FULL_PERSISTENCE_CHECKS, "persistence integration")
+            for name in _FULL_PERSISTENCE_SCRIPTS
+        ]
+        jobs += [
+            (name, _SAVE_ONLY_CHECKS, "save-only persistence integration")
+            for name in _SAVE_ONLY_SCRIPTS
+        ]
 
-            # Test dictionary methods
-            test_dict = {"a": 1, "b": 2}
-            keys = test_dict.keys()
-            if "a" not in keys or "b" not in keys:
-                raise Exception("Dictionary methods test failed")
+        # Check every script before failing so one run reports all problems
+        existing = set(os.listdir(SCRIPTS_DIR))
+        problems = []
+        for script_name, checks, kind in jobs:
+            problem = _validate_script(script_name, checks, existing)
+            if problem is None:
+                self.log("Script {} has {}".format(script_name, kind))
+            else:
+                problems.append(problem)
 
-            # Test exception handling
-            try:
-                raise ValueError("test exception")
-            except ValueError as e:
-                if "test exception" not in str(e):
-                    raise Exception("Exception handling test failed")
+        if problems:
+            raise Exception("; ".join(problems))
 
-            self.log("String formatting compatible")
-            self.log("Dictionary methods compatible")
-            self.log("Exception handling compatible")
+        self.report(_OK, "All scripts have persistence integration")
 
-            print("  ✓ Python 2.7 compatibility verified")
-            self.passed += 1
-            return True
+    @_counted("Python 2.7 compatibility test failed")
+    def test_python27_compatibility(self):
+        """Test Python 2.7 specific compatibility"""
+        print("5. Testing Python 2.7 compatibility...")
 
-        except Exception as e:
-            print("  ❌ Python 2.7 compatibility test failed: {}".format(e))
-            self.failed += 1
-            return False
+        # String formatting, dict views and ``except ... as`` are exercised by
+        # this module itself, so reaching this point on 2.7 already proves them.
+        # Only the interpreter version remains to be checked.
+        if sys.version_info[:2] != (2, 7):
+            self.report(
+                _WARN,
+                "Warning: Not running on Python 2.7 ({}.{})".format(
+                    sys.version_info[0], sys.version_info[1]
+                ),
+            )
 
+        self.report(_OK, "Python 2.7 compatibility verified")
+
+    @_counted("Home polling optimization test failed")
     def test_home_polling_optimization(self):
         """Test home switch polling optimization features (C2)"""
         print("6. Testing home switch polling optimization...")
 
-        try:
-            from dome import Dome
-
-            # Create test config with mock mode
-            config = {
-                "pins": {
-                    "encoder_a": 1,
-                    "encoder_b": 5,
-                    "home_switch": 2,
-                    "dome_rotate": 1,
-                    "dome_direction": 2,
-                    "shutter_move": 5,
-                    "shutter_direction": 6,
-                },
-                "calibration": {
-                    "home_position": 225,
-                    "ticks_to_degrees": 4.0,
-                    "poll_interval": 0.5,
-                    "home_poll_fast": 0.05,
-                    "home_switch_debounce": 0.1,
-                },
-                "hardware": {"mock_mode": True, "device_port": 0},
-                "testing": {"smoke_test": True, "smoke_test_timeout": 3.0},
-            }
-
-            dome = Dome(config)
-
-            # Test configuration loading
-            if not (dome.home_poll_fast < dome.POLL):
-                raise Exception("Fast polling should be faster than normal polling")
-            if not (dome.home_poll_fast > 0.01):
-                raise Exception("Fast polling rate too aggressive")
-            if not (dome.home_switch_debounce > 0):
-                raise Exception("Debounce time should be positive")
-
-            # Test diagnostic methods
-            home_diag = dome.get_home_polling_diagnostics()
-            required_keys = ["polling_rates", "signal_validation", "speed_tracking"]
-            for key in required_keys:
-                if key not in home_diag:
-                    raise Exception("Missing home diagnostic key: {}".format(key))
-
-            # Test enhanced home detection
-            basic_result = dome.isHome()
-            enhanced_result = dome.is_home_with_validation()
-            self.log("Basic home detection: {}".format(basic_result))
-            self.log("Enhanced home detection: {}".format(enhanced_result))
-            # Both should return same result in mock mode
-
-            # Test polling rate switching simulation
-            original_poll = dome.POLL
-            dome.home_poll_normal = original_poll
-            dome.POLL = dome.home_poll_fast
-            dome.POLL = dome.home_poll_normal
-            if dome.POLL != original_poll:
-                raise Exception("Failed to restore original polling rate")
-
-            self.log("Home polling configuration validated")
-            self.log("Diagnostic methods working")
-            self.log("Enhanced detection methods available")
-            self.log("Polling rate switching functional")
-
-            print("  ✓ Home switch polling optimization working")
-            self.passed += 1
-            return True
-
-        except Exception as e:
-            print("  ❌ Home polling optimization test failed: {}".format(e))
-            self.failed += 1
-            return False
+        dome = self.shared_dome("calibrated")
+
+        # Test configuration loading
+        if not (dome.home_poll_fast < dome.POLL):
+            raise Exception("Fast polling should be faster than normal polling")
+        if not (dome.home_poll_fast > 0.01):
+            raise Exception("Fast polling rate too aggressive")
+        if not (dome.home_switch_debounce > 0):
+            raise Exception("Debounce time should be positive")
+
+        # Test diagnostic methods
+        home_diag = dome.get_home_polling_diagnostics()
+        _require_keys(
+            home_diag,
+            ["polling_rates", "signal_validation", "speed_tracking"],
+            "home diagnostic",
+        )
 
+        # Test enhanced home detection
+        basic_result = dome.isHome()
+        enhanced_result = dome.is_home_with_validation()
+        self.log("Basic home detection: {}".format(basic_result))
+        self.log("Enhanced home detection: {}".format(enhanced_result))
+        # Both should return same result in mock mode
+
+        # Test polling rate switching simulation
+        original_poll = dome.POLL
+        dome.home_poll_normal = original_poll
+        dome.POLL = dome.home_poll_fast
+        dome.POLL = dome.home_poll_normal
+        if dome.POLL != original_poll:
+            raise Exception("Failed to restore original polling rate")
+
+        self.log("Home polling configuration validated")
+        self.log("Diagnostic methods working")
+        self.log("Enhanced detection methods available")
+        self.log("Polling rate switching functional")
+
+        self.report(_OK, "Home switch polling optimization working")
+
+    @_counted("Encoder calibration system test failed")
     def test_encoder_calibration_system(self):
         """Test encoder calibration and validation system (C3)"""
         print("7. Testing encoder calibration system...")
 
-        try:
-            from dome import Dome
+        dome = self.shared_dome("calibrated")
+
+        # Test configuration loading
+        if dome.TICKS_TO_DEG <= 0:
+            raise Exception("Ticks to degrees should be positive")
+        if dome.encoder_error_threshold <= 0:
+            raise Exception("Error threshold should be positive")
+        if dome.encoder_calibration_timeout < 60:
+            raise Exception("Calibration timeout should be reasonable")
+
+        # Test calibration status method
+        status = dome.get_encoder_calibration_status()
+        _require_keys(
+            status,
+            ["current_config", "performance", "recommendations"],
+            "calibration status",
+        )
 
-            # Create test config with mock mode
-            config = {
-                "pins": {
-                    "encoder_a": 1,
-                    "encoder_b": 5,
-                    "home_switch": 2,
-                    "dome_rotate": 1,
-                    "dome_direction": 2,
-                    "shutter_move": 5,
-                    "shutter_direction": 6,
-                },
-                "calibration": {
-                    "home_position": 225,
-                    "ticks_to_degrees": 4.0,
-                    "poll_interval": 0.5,
-                    "encoder_error_threshold": 50,
-                    "encoder_calibration_timeout": 180.0,
-                },
-                "hardware": {"mock_mode": True, "device_port": 0},
-                "testing": {"smoke_test": True, "smoke_test_timeout": 3.0},
-            }
-
-            dome = Dome(config)
-
-            # Test configuration loading
-            if dome.TICKS_TO_DEG <= 0:
-                raise Exception("Ticks to degrees should be positive")
-            if dome.encoder_error_threshold <= 0:
-                raise Exception("Error threshold should be positive")
-            if dome.encoder_calibration_timeout < 60:
-                raise Exception("Calibration timeout should be reasonable")
-
-            # Test calibration status method
-            status = dome.get_encoder_calibration_status()
-            required_keys = ["current_config", "performance", "recommendations"]
-            for key in required_keys:
-                if key not in status:
-                    raise Exception("Missing calibration status key: {}".format(key))
-
-            # Test enhanced encoder diagnostics
-            encoder_diag = dome.get_encoder_diagnostics()
-            required_keys = [
+        # Test enhanced encoder diagnostics
+        encoder_diag = dome.get_encoder_diagnostics()
+        _require_keys(
+            encoder_diag,
+            [
                 "current_state",
                 "direction",
                 "speed_deg_per_sec",
                 "max_speed_deg_per_sec",
                 "error_count",
                 "encoder_pins",
-            ]
-            for key in required_keys:
-                if key not in encoder_diag:
-                    raise Exception("Missing encoder diagnostic key: {}".format(key))
-
-            # Test error detection and recovery
-            dome.encoder_errors = 5
-            dome.reset_encoder_tracking()
-            if dome.encoder_errors != 0:
-                raise Exception("Error count should be reset to 0")
-
-            # Test encoder tracking enhancement
-            for i in range(5):
-                result = dome.update_encoder_tracking()
-                if not result:
-                    raise Exception("update_encoder_tracking should return True")
-
-            # Test consistency validation method exists
-            try:
-                results = dome.validate_encoder_consistency(test_duration=2.0)
-                required_keys = ["test_duration", "total_samples", "validation_passed"]
-                for key in required_keys:
-                    if key not in results:
-                        raise Exception("Missing validation result key: {}".format(key))
-            except Exception as e:
-                # Acceptable in mock mode
-                self.log("Consistency validation limited in mock mode: {}".format(e))
+            ],
+            "encoder diagnostic",
+        )
 
-            self.log("Encoder calibration configuration loaded")
-            self.log("Calibration status reporting working")
-            self.log("Enhanced diagnostics available")
-            self.log("Error detection and recovery functional")
-            self.log("Encoder tracking enhancements working")
+        # Test error detection and recovery
+        dome.encoder_errors = 5
+        dome.reset_encoder_tracking()
+        if dome.encoder_errors != 0:
+            raise Exception("Error count should be reset to 0")
 
-            print("  ✓ Encoder calibration system working")
-            self.passed += 1
-            return True
+        # Test encoder tracking enhancement
+        if not all(dome.update_encoder_tracking() for _ in range(5)):
+            raise Exception("update_encoder_tracking should return True")
 
+        # Test consistency validation method exists
+        try:
+            results = dome.validate_encoder_consistency(test_duration=2.0)
+            _require_keys(
+                results,
+                ["test_duration", "total_samples", "validation_passed"],
+                "validation result",
+            )
         except Exception as e:
-            print("  ❌ Encoder calibration system test failed: {}".format(e))
-            self.failed += 1
-            return False
-
-    def cleanup(self):
-        """Clean up temporary files"""
-        for temp_file in self.temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    temp_dir = os.path.dirname(temp_file)
-                    if os.path.exists(temp_dir):
-                        os.rmdir(temp_dir)
-            except OSError:
-                pass
+            # Acceptable in mock mode
+            self.log("Consistency validation limited in mock mode: {}".format(e))
+
+        self.log("Encoder calibration configuration loaded")
+        self.log("Calibration status reporting working")
+        self.log("Enhanced diagnostics available")
+        self.log("Error detection and recovery functional")
+        self.log("Encoder tracking enhancements working")
+
+        self.report(_OK, "Encoder calibration system working")
+
+    # Run order for run_all_tests, resolved once when the class is created
+    _TESTS = (
+        test_imports,
+        test_dome_creation,
+        test_persistence_functionality,
+        test_script_integration,
+        test_python27_compatibility,
+        test_home_polling_optimization,
+        test_encoder_calibration_system,
+    )
 
     def run_all_tests(self):
-        """Run all validation tests"""
+        """Run all validation tests, writing their output to stdout in one batch
+
+        Everything printed during the run, including by the driver modules, is
+        collected in memory and written out at the end. Output is flushed early
+        whenever a test fails so CI logs show the failure straight away.
+        """
+        stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            return self._run_all_tests(stdout)
+        finally:
+            self._flush_output(stdout)
+            sys.stdout = stdout
+
+    def _flush_output(self, stdout):
+        """Write buffered output to the real stdout and empty the buffer"""
+        stdout.write(sys.stdout.getvalue())
+        stdout.flush()
+        sys.stdout.seek(0)
+        sys.stdout.truncate(0)
+
+    def _run_all_tests(self, stdout):
         print("Python 2.7 Dome Driver Validation Suite")
         print("=" * 45)
         print("Python version: {}".format(sys.version))
         print("")
 
-        try:
-            # Run all tests
-            self.test_imports()
-            self.test_dome_creation()
-            self.test_persistence_functionality()
-            self.test_script_integration()
-            self.test_python27_compatibility()
-            self.test_home_polling_optimization()
-            self.test_encoder_calibration_system()
-
-            # Print summary
+        # Run all tests
+        for test in self._TESTS:
+            if test(self):
+                continue
+            self._flush_output(stdout)
+            if self.fail_fast:
+                print("")
+                print("Stopping after first failure (--fail-fast)")
+                break
+
+        # Print summary
+        print("")
+        print("=" * 45)
+        print("VALIDATION SUMMARY")
+        print("Passed: {}".format(self.passed))
+        print("Failed: {}".format(self.failed))
+        print("Total:  {}".format(self.passed + self.failed))
+
+        if self.failed == 0:
             print("")
-            print("=" * 45)
-            print("VALIDATION SUMMARY")
-            print("Passed: {}".format(self.passed))
-            print("Failed: {}".format(self.failed))
-            print("Total:  {}".format(self.passed + self.failed))
+            print("🎉 ALL VALIDATION TESTS PASSED!")
+            print("Python 2.7 dome driver is ready for deployment.")
+            return True
+        else:
+            print("")
+            print("❌ SOME VALIDATION TESTS FAILED!")
+            print("Please review failures before deployment.")
+            return False
 
-            if self.failed == 0:
-                print("")
-                print("🎉 ALL VALIDATION TESTS PASSED!")
-                print("Python 2.7 dome driver is ready for deployment.")
-                return True
-            else:
-                print("")
-                print("❌ SOME VALIDATION TESTS FAILED!")
-                print("Please review failures before deployment.")
-                return False
 
-        finally:
-            self.cleanup()
+def _input_digest():
+    """Hash the mtimes of everything the suite validates, plus the interpreter
+
+    Covers the validator, every module under LIB_DIR (any of them can be
+    imported by the modules under test) and the INDI scripts.
+    """
+    paths = [os.path.abspath(__file__)]
+    for root, dirs, files in os.walk(LIB_DIR):
+        dirs.sort()
+        paths += [
+            os.path.join(root, name) for name in sorted(files) if name.endswith(".py")
+        ]
+    paths += [
+        os.path.join(SCRIPTS_DIR, name)
+        for name in _FULL_PERSISTENCE_SCRIPTS + _SAVE_ONLY_SCRIPTS
+    ]
+
+    digest = hashlib.sha1(sys.version.encode("utf-8"))
+    for path in paths:
+        try:
+            stamp = repr(os.path.getmtime(path))
+        except OSError:
+            stamp = "missing"
+        digest.update("{}={}\n".format(path, stamp).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _load_cached_digest():
+    """Return the digest of the last passing run, or None if there is none"""
+    try:
+        with open(_CACHE_FILE, "r") as f:
+            cached = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if cached.get("result") != "pass":
+        return None
+    return cached.get("digest")
+
+
+def _store_cached_digest(digest):
+    """Record a passing run; failures to write the cache are not fatal"""
+    try:
+        cache_dir = os.path.dirname(_CACHE_FILE)
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        with open(_CACHE_FILE, "w") as f:
+            json.dump({"digest": digest, "result": "pass"}, f)
+    except (IOError, OSError) as e:
+        print("Could not write validation cache: {}".format(e))
 
 
 def main():
     """Main test runner"""
-    verbose = "--verbose" in sys.argv or "-v" in sys.argv
-    persistence_only = "--persistence-only" in sys.argv
+    args = set(sys.argv[1:])
+    verbose = "--verbose" in args or "-v" in args
+    persistence_only = "--persistence-only" in args
+    fail_fast = "--fail-fast" in args or "-x" in args
 
-    validator = ValidationTests(verbose=verbose)
+    validator = ValidationTests(verbose=verbose, fail_fast=fail_fast)
 
     if persistence_only:
         print("Running persistence validation only...")
-        success = validator.test_persistence_functionality()
-        validator.cleanup()
-        return success
-    else:
-        return validator.run_all_tests()
+        return validator.test_persistence_functionality()
+
+    use_cache = "--cache" in args
+    if use_cache:
+        digest = _input_digest()
+        if _load_cached_digest() == digest:
+            print("Validation inputs unchanged since last passing run (cached pass)")
+            return True
+
+    success = validator.run_all_tests()
+    if success and use_cache:
+        _store_cached_digest(digest)
+    return success
 
 
 if __name__ == "__main__":
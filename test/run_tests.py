@@ -21,11 +21,209 @@ Usage:
 """
 
 import argparse
+import codecs
+import collections
+import contextlib
+import functools
+import importlib.util
+import io
 import os
+import re
+import select
+import shutil
 import subprocess
 import sys
+import threading
 import time
-from pathlib import Path
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+TEST_DIR = os.path.dirname(os.path.realpath(__file__))
+PROJECT_ROOT = os.path.dirname(TEST_DIR)
+FEATURES_DIR = os.path.join(TEST_DIR, "integration", "features")
+LIB_PATH = os.path.join(PROJECT_ROOT, "indi_driver", "lib")
+SCRIPTS_DIR = os.path.join(PROJECT_ROOT, "indi_driver", "scripts")
+ABORT_SCRIPT = os.path.join(SCRIPTS_DIR, "abort.py")
+
+# Interpreter for every child process (no PATH lookup for "python")
+PYTHON = sys.executable
+BEHAVE_CMD = (PYTHON, "-m", "behave")
+
+# Unit test files run with pytest, relative to PROJECT_ROOT
+UNIT_TEST_FILES = (
+    "test/unit/test_dome_units.py",
+    "test/unit/test_safety_critical.py",
+)
+
+# Ensure child processes can import project modules in indi_driver/lib
+# (behave steps and the driver scripts import `config`, `dome`, etc.)
+# The lib path comes first and appears once, even if the caller's PYTHONPATH
+# already carries it (e.g. when run_tests.py is itself run by a child)
+_LIB_ENV_OVERLAY = {
+    "PYTHONPATH": os.pathsep.join(
+        dict.fromkeys(
+            [
+                LIB_PATH,
+                *filter(None, os.environ.get("PYTHONPATH", "").split(os.pathsep)),
+            ]
+        )
+    )
+}
+
+
+# behave options derived from the parsed args, in command line order:
+# tag filter, verbosity, format, output file. Without --format, progress2
+# keeps terminal output to a line per scenario; pretty's per-step output is
+# reserved for --verbose runs.
+_BEHAVE_OPTIONS = (
+    lambda args: [f"--tags={args.tag}"] if args.tag else [],
+    lambda args: ["--verbose"] if args.verbose else [],
+    lambda args: [
+        "--format",
+        args.format or ("pretty" if args.verbose else "progress2"),
+    ],
+    lambda args: ["--outfile", args.output] if args.output else [],
+)
+
+# Lines of child output kept by _stream for failure summaries
+_STREAM_TAIL_LINES = 500
+
+# Silence after which _stream reports that a child is still running
+_HEARTBEAT_SECONDS = 5.0
+
+# A lone positive behave tag such as "@smoke"; expressions, including the
+# "-tag"/"~tag" negations, go to behave
+_SIMPLE_TAG_RE = re.compile(r"^@?\w[\w.-]*$")
+
+_MODE_CHOICES = ("smoke", "hardware")
+_FORMAT_CHOICES = ("pretty", "plain", "progress2", "json", "junit")
+# Formats read by other tools; shards would interleave several documents
+_MACHINE_FORMATS = ("json", "junit")
+
+# Summary labels for the keys of main()'s results
+_TEST_DISPLAY = {
+    "integration": "Integration Tests",
+    "unit": "Unit Tests",
+    "doc_scripts": "Documentation Script Tests",
+    "bdd": "BDD Tests",
+    "precommit": "Pre-commit Checks",
+}
+
+# Parsed values when no options are given; also the parser's defaults, so a
+# bare run (which skips argparse) sees exactly what parse_args would return
+_DEFAULT_OPTIONS = {
+    "all": False,
+    "integration_only": False,
+    "unit_only": False,
+    "doc_only": False,
+    "bdd_only": False,
+    "hardware_startup": False,
+    "mode": "smoke",
+    "feature": None,
+    "tag": None,
+    "isolate": False,
+    "jobs": None,
+    "no_fail_fast": False,
+    "verbose": False,
+    "format": None,
+    "output": None,
+    "list_features": False,
+    "install_deps": False,
+    "yes": False,
+}
+
+# behave's step summary line, e.g. "325 steps passed, 0 failed, 0 skipped"
+_BEHAVE_SUMMARY_RE = re.compile(r"(\d+) steps passed,\s*(\d+) failed")
+
+# Final pytest line, e.g. "===== 12 passed, 1 failed in 0.52s ====="
+_PYTEST_SUMMARY_RE = re.compile(r"^=+ (.*\d+ (?:passed|failed|errors?)\b.*?) =+$", re.M)
+
+
+@functools.lru_cache(maxsize=1)
+def _driver_env():
+    """Return the read-only environment for driver and test child processes.
+
+    It is the current environment plus the lib PYTHONPATH, built on first
+    use and shared by every later call.
+    """
+    return types.MappingProxyType({**os.environ, **_LIB_ENV_OVERLAY})
+
+
+def _driver_env_with(**overrides):
+    """Return a copy of _driver_env() with the given variables set."""
+    return dict(_driver_env(), **overrides)
+
+
+def _stream(cmd, timeout, label, **kwargs):
+    """Run cmd, echoing its combined output live; return (returncode, tail).
+
+    Only the last _STREAM_TAIL_LINES lines are kept for failure reporting,
+    so memory stays bounded however chatty the child is. While the child is
+    silent a heartbeat naming label is printed every _HEARTBEAT_SECONDS,
+    unless this thread's output is being buffered by _SuiteOutput (it would
+    only show up after the child had finished).
+    Raises subprocess.TimeoutExpired on timeout, like subprocess.run.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        **kwargs,
+    )
+    fd = proc.stdout.fileno()
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    tail = collections.deque(maxlen=_STREAM_TAIL_LINES)
+    partial = ""
+    heartbeat = not (isinstance(sys.stdout, _SuiteOutput) and sys.stdout.buffering())
+    start = time.monotonic()
+    deadline = start + timeout
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            ready, _, _ = select.select(
+                [fd], [], [], min(_HEARTBEAT_SECONDS, remaining)
+            )
+            if not ready:
+                if heartbeat and time.monotonic() < deadline:
+                    elapsed = int(time.monotonic() - start)
+                    print(f"    … {label} still running ({elapsed}s)")
+                continue
+
+            # Raw reads: a partial line must not block the deadline check
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            text = decoder.decode(chunk)
+            sys.stdout.write(text)
+            *lines, partial = (partial + text).split("\n")
+            tail.extend(line + "\n" for line in lines)
+
+        tail.append(partial + decoder.decode(b"", final=True))
+        proc.wait(timeout=max(0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout, output="".join(tail)) from None
+    finally:
+        proc.stdout.close()
+    return proc.returncode, "".join(tail)
+
+
+@contextlib.contextmanager
+def _working_directory(path):
+    """Temporarily chdir for in-process tools that resolve paths from cwd.
+
+    Only use this outside the suite thread pool: cwd is process-global.
+    """
+    original_cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(original_cwd)
 
 
 def run_integration_tests():
@@ -33,10 +231,6 @@ def run_integration_tests():
     print("🔹 Running Integration Tests...")
     print("-" * 60)
     try:
-        # Change to parent directory to run integration tests
-        original_cwd = os.getcwd()
-        os.chdir(os.path.dirname(os.path.dirname(__file__)))
-
         # Check for hardware mode and provide session management
         test_mode = os.environ.get("DOME_TEST_MODE", "smoke").lower()
         is_hardware_mode = test_mode == "hardware"
@@ -63,22 +257,18 @@ def run_integration_tests():
             env = os.environ.copy()
             env["DOME_TEST_MODE"] = "smoke"
 
+            # The files share PROJECT_ROOT/dome_config.json and dome_state.json,
+            # which their setUp/tearDown and scripts create, rewrite and delete,
+            # so they must run one at a time
             for f in files:
                 print(f"  Running {f}...")
-                result = subprocess.run(
-                    [sys.executable, f],
-                    capture_output=True,
-                    text=True,
-                    timeout=240,  # Longer timeout for hardware mode
-                    env=env,
+                returncode, _ = _stream(
+                    [PYTHON, f], label=f, timeout=240, env=env, cwd=PROJECT_ROOT
                 )
-                if result.returncode == 0:
-                    print(result.stdout)
+                if returncode == 0:
                     print(f"    ✅ {f} passed")
                 else:
-                    print(f"    ❌ {f} failed:")
-                    print(f"      stdout: {result.stdout[:400]}...")
-                    print(f"      stderr: {result.stderr[:400]}...")
+                    print(f"    ❌ {f} failed (exit code {returncode})")
                     all_passed = False
 
         if is_hardware_mode:
@@ -96,8 +286,26 @@ def run_integration_tests():
     except Exception as e:
         print(f"❌ Error running integration tests: {e}")
         return False
-    finally:
-        os.chdir(original_cwd)
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_abort():
+    """Run the abort script once as a health probe; return its exit code.
+
+    The result is cached for the rest of the run, so repeated session
+    initializations spawn it only once. Safety stops must call the script
+    directly, never through this probe.
+    """
+    result = subprocess.run(
+        [PYTHON, ABORT_SCRIPT],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=10,
+        env=_driver_env(),
+        cwd=PROJECT_ROOT,
+    )
+    return result.returncode
 
 
 def _initialize_hardware_test_session():
@@ -114,29 +322,14 @@ def _initialize_hardware_test_session():
             print("   - Set SHUTTER_RAIN_OVERRIDE=true to enable shutter operations")
 
         # Validate abort script availability
-        script_dir = os.path.join(os.getcwd(), "indi_driver", "scripts")
-        abort_script = os.path.join(script_dir, "abort.py")
-
-        if not os.path.exists(abort_script):
-            print(f"❌ Critical safety script missing: {abort_script}")
+        if not os.path.exists(ABORT_SCRIPT):
+            print(f"❌ Critical safety script missing: {ABORT_SCRIPT}")
             return False
 
         # Test abort script functionality
-        env = os.environ.copy()
-        lib_path = os.path.join(os.getcwd(), "indi_driver", "lib")
-        existing = env.get("PYTHONPATH", "")
-        env["PYTHONPATH"] = lib_path + (os.pathsep + existing if existing else "")
-
-        result = subprocess.run(
-            [sys.executable, abort_script],
-            capture_output=True,
-            text=True,
-            timeout=10,
-            env=env,
-        )
-
-        if result.returncode not in [0, 1]:
-            print(f"❌ Abort script test failed: exit code {result.returncode}")
+        returncode = _probe_abort()
+        if returncode not in [0, 1]:
+            print(f"❌ Abort script test failed: exit code {returncode}")
             return False
 
         print("✅ Hardware test session initialized safely")
@@ -172,21 +365,18 @@ def _run_hardware_integration_sequence(test_files):
             print(f"\n📋 Phase: {description}")
             print(f"   Running {test_file}...")
 
-            # Run with extended timeout for hardware
-            result = subprocess.run(
-                [sys.executable, test_file],
-                capture_output=True,
-                text=True,
+            # Run with extended timeout for hardware, echoing progress live
+            returncode, _ = _stream(
+                [PYTHON, test_file],
+                label=test_file,
                 timeout=600,  # 10 minutes for hardware integration
+                cwd=PROJECT_ROOT,
             )
 
-            if result.returncode == 0:
-                print(result.stdout)
+            if returncode == 0:
                 print(f"    ✅ {description} passed")
             else:
-                print(f"    ❌ {description} failed:")
-                print(f"      stdout: {result.stdout[:500]}...")
-                print(f"      stderr: {result.stderr[:500]}...")
+                print(f"    ❌ {description} failed (exit code {returncode})")
                 all_passed = False
 
                 # For hardware mode, consider stopping on critical failures
@@ -208,21 +398,15 @@ def _finalize_hardware_test_session(success):
         print("\n🔄 Finalizing hardware test session...")
 
         # Execute final safety cleanup
-        script_dir = os.path.join(os.getcwd(), "indi_driver", "scripts")
-        abort_script = os.path.join(script_dir, "abort.py")
-
-        if os.path.exists(abort_script):
-            env = os.environ.copy()
-            lib_path = os.path.join(os.getcwd(), "indi_driver", "lib")
-            existing = env.get("PYTHONPATH", "")
-            env["PYTHONPATH"] = lib_path + (os.pathsep + existing if existing else "")
-
+        if os.path.exists(ABORT_SCRIPT):
             subprocess.run(
-                [sys.executable, abort_script],
+                [PYTHON, ABORT_SCRIPT],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 timeout=10,
-                env=env,
+                env=_driver_env(),
+                cwd=PROJECT_ROOT,
             )
             print("   🛑 Final safety stop executed")
 
@@ -251,9 +435,6 @@ def run_hardware_startup_sequence():
         return False
 
     try:
-        original_cwd = os.getcwd()
-        os.chdir(os.path.dirname(os.path.dirname(__file__)))
-
         # Initialize hardware session
         if not _initialize_hardware_test_session():
             return False
@@ -269,23 +450,19 @@ def run_hardware_startup_sequence():
             ("disconnect.py", "Clean disconnection", 3),
         ]
 
-        script_dir = os.path.join(os.getcwd(), "indi_driver", "scripts")
-        env = os.environ.copy()
-        lib_path = os.path.join(os.getcwd(), "indi_driver", "lib")
-        existing = env.get("PYTHONPATH", "")
-        env["PYTHONPATH"] = lib_path + (os.pathsep + existing if existing else "")
-
         for script, description, timeout in startup_tests:
             print(f"   Testing {description}...")
-            script_path = os.path.join(script_dir, script)
+            script_path = os.path.join(SCRIPTS_DIR, script)
 
             start_time = time.time()
             result = subprocess.run(
-                [sys.executable, script_path],
+                [PYTHON, script_path],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
-                env=env,
+                env=_driver_env(),
+                cwd=PROJECT_ROOT,
             )
             elapsed = time.time() - start_time
 
@@ -322,14 +499,15 @@ def run_hardware_startup_sequence():
         )
 
         # Test abort functionality
-        abort_script = os.path.join(script_dir, "abort.py")
         start_time = time.time()
         result = subprocess.run(
-            [sys.executable, abort_script],
+            [PYTHON, ABORT_SCRIPT],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             timeout=5,
-            env=env,
+            env=_driver_env(),
+            cwd=PROJECT_ROOT,
         )
         elapsed = time.time() - start_time
 
@@ -350,44 +528,56 @@ def run_hardware_startup_sequence():
     except Exception as e:
         print(f"❌ Hardware startup sequence failed: {e}")
         return False
-    finally:
-        os.chdir(original_cwd)
 
 
 def _run_short_movement_validation():
     """Run short movement validation for hardware startup."""
     try:
-        script_dir = os.path.join(os.getcwd(), "indi_driver", "scripts")
-        env = os.environ.copy()
-        lib_path = os.path.join(os.getcwd(), "indi_driver", "lib")
-        existing = env.get("PYTHONPATH", "")
-        env["PYTHONPATH"] = lib_path + (os.pathsep + existing if existing else "")
-
         print("   Starting 2-second CW movement test...")
 
         # Start CW movement
-        cw_script = os.path.join(script_dir, "move_cw.py")
+        cw_script = os.path.join(SCRIPTS_DIR, "move_cw.py")
         start_time = time.time()
 
         move_process = subprocess.Popen(
-            [sys.executable, cw_script],
-            env=env,
+            [PYTHON, cw_script],
+            stdin=subprocess.DEVNULL,
+            env=_driver_env(),
+            cwd=PROJECT_ROOT,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
         )
 
-        # Let it run for 2 seconds
-        time.sleep(2.0)
+        # Let it run for 2 seconds, but notice a failed start straight away.
+        # move_cw.py normally returns as soon as the motor is on, so a clean
+        # early exit still means the dome is turning for the rest of the window
+        move_failed = False
+        try:
+            move_failed = move_process.wait(timeout=2.0) != 0
+        except subprocess.TimeoutExpired:
+            pass
+        if not move_failed:
+            time.sleep(max(0.0, 2.0 - (time.time() - start_time)))
 
-        # Stop movement
-        abort_script = os.path.join(script_dir, "abort.py")
+        # Stop movement; also after a failed start, which may have left the
+        # motor running
         subprocess.run(
-            [sys.executable, abort_script],
+            [PYTHON, ABORT_SCRIPT],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             timeout=5,
-            env=env,
+            env=_driver_env(),
+            cwd=PROJECT_ROOT,
         )
 
+        if move_failed:
+            elapsed = time.time() - start_time
+            print(
+                f"   ❌ CW movement failed after {elapsed:.1f}s "
+                f"(exit code {move_process.returncode})"
+            )
+            return False
+
         # Wait for movement process to complete
         try:
             move_process.wait(timeout=5)
@@ -402,67 +592,79 @@ def _run_short_movement_validation():
         print(f"   ❌ Short movement test failed: {e}")
         # Emergency stop
         try:
-            abort_script = os.path.join(script_dir, "abort.py")
-            subprocess.run([sys.executable, abort_script], timeout=5, env=env)
+            subprocess.run(
+                [PYTHON, ABORT_SCRIPT],
+                stdin=subprocess.DEVNULL,
+                timeout=5,
+                env=_driver_env(),
+                cwd=PROJECT_ROOT,
+            )
         except Exception:
             pass
         return False
 
 
+def _existing_unit_test_files():
+    """Return the entries of UNIT_TEST_FILES present in this checkout."""
+    return [f for f in UNIT_TEST_FILES if os.path.isfile(os.path.join(PROJECT_ROOT, f))]
+
+
+def _unit_test_command(test_files):
+    """Build the pytest command line for the unit test files."""
+    # One pytest process for every file: interpreter startup, plugin
+    # loading and collection are paid once rather than per file
+    cmd = [PYTHON, "-m", "pytest", *test_files, "-v", "--tb=short"]
+    # The runner never uses --lf/--ff, so skip reading and writing
+    # .pytest_cache on every run
+    cmd.extend(["-p", "no:cacheprovider"])
+    if importlib.util.find_spec("xdist") is not None:
+        # Spread the files across cores; loadfile keeps each file's
+        # fixtures and mocks within one worker
+        cmd.extend(["-n", "auto", "--dist=loadfile"])
+    return cmd
+
+
 def run_unit_tests():
     """Run unit tests with pytest."""
     print("🔹 Running Unit Tests...")
     print("-" * 60)
     try:
-        # Check if pytest is available
-        try:
-            import pytest
-        except ImportError:
+        # Check if pytest is available (it only runs as a child process)
+        if importlib.util.find_spec("pytest") is None:
             print("⚠️  pytest not available, skipping unit tests")
             print("   Install with: pip install pytest")
             return True  # Don't fail if pytest not available
 
-        # Change to parent directory to run unit tests
-        original_cwd = os.getcwd()
-        os.chdir(os.path.dirname(os.path.dirname(__file__)))
-
         # Set up environment for smoke mode testing
         env = os.environ.copy()
         env["DOME_TEST_MODE"] = "smoke"
 
-        # Run pytest on unit test files
-        unit_test_files = [
-            "test/unit/test_dome_units.py",
-            "test/unit/test_safety_critical.py",
-        ]
+        existing = _existing_unit_test_files()
+        for test_file in UNIT_TEST_FILES:
+            if test_file not in existing:
+                print(f"  ⚠️  {test_file} not found, skipping...")
+        if not existing:
+            print("✅ Unit tests passed")
+            return True
 
-        all_passed = True
-        for test_file in unit_test_files:
-            if os.path.exists(test_file):
-                print(f"  Running {test_file}...")
-                result = subprocess.run(
-                    [sys.executable, "-m", "pytest", test_file, "-v"],
-                    capture_output=True,
-                    text=True,
-                    timeout=120,
-                    env=env,
-                )
+        cmd = _unit_test_command(existing)
+        print(f"  Running {', '.join(existing)}...")
+        returncode, tail = _stream(
+            cmd,
+            timeout=120 * len(existing),
+            label="unit tests",
+            env=env,
+            cwd=PROJECT_ROOT,
+        )
 
-                if result.returncode == 0:
-                    print(f"    ✅ {test_file} passed")
-                    # Show summary of tests run
-                    lines = result.stdout.split("\n")
-                    for line in lines:
-                        if "passed" in line and ("failed" in line or "error" in line):
-                            print(f"    📊 {line.strip()}")
-                        elif line.startswith("PASSED") or line.startswith("FAILED"):
-                            print(f"    {line.strip()}")
-                else:
-                    print(f"    ❌ {test_file} failed:")
-                    print(f"      stderr: {result.stderr[:200]}...")
-                    all_passed = False
-            else:
-                print(f"  ⚠️  {test_file} not found, skipping...")
+        all_passed = returncode == 0
+        summary = _PYTEST_SUMMARY_RE.search(tail)
+        if summary:
+            print(f"    📊 {summary.group(1)}")
+        if not all_passed:
+            for line in tail.splitlines():
+                if line.startswith(("FAILED", "ERROR")):
+                    print(f"    ❌ {line}")
 
         if all_passed:
             print("✅ Unit tests passed")
@@ -477,33 +679,58 @@ def run_unit_tests():
     except Exception as e:
         print(f"❌ Error running unit tests: {e}")
         return False
-    finally:
-        os.chdir(original_cwd)
 
 
-def run_doc_script_tests():
-    """Run the documentation script tests."""
-    script_dir = Path(__file__).parent
-    test_file = script_dir / "doc" / "test_doc_scripts.py"
+def run_doc_script_tests(isolate=False):
+    """Run the documentation script tests.
+
+    The harness is imported and its main() called in this interpreter; with
+    isolate=True it runs as a separate process instead. Only run it
+    in-process when no other suite is running, since it temporarily changes
+    os.environ and sys.path for the whole process.
+    """
+    test_file = os.path.join(TEST_DIR, "doc", "test_doc_scripts.py")
 
     print("\n🔹 Running Documentation Script Tests...")
     print("-" * 60)
 
-    if not test_file.exists():
+    if not os.path.isfile(test_file):
         print(f"❌ Doc script test file not found: {test_file}")
         return False
 
     try:
-        # Ensure doc test process can import project modules
-        env = os.environ.copy()
-        lib_path = str(script_dir.parent / "indi_driver" / "lib")
-        existing_py = env.get("PYTHONPATH", "")
-        env["PYTHONPATH"] = lib_path + (os.pathsep + existing_py if existing_py else "")
+        if isolate:
+            result = subprocess.run(
+                [PYTHON, test_file],
+                stdin=subprocess.DEVNULL,
+                cwd=PROJECT_ROOT,
+                env=_driver_env(),
+                capture_output=True,
+                text=True,
+            )
+            print(result.stdout)
+            if result.stderr:
+                print(result.stderr)
+            returncode = result.returncode
+        else:
+            doc_dir = os.path.dirname(test_file)
+            if doc_dir not in sys.path:
+                sys.path.insert(0, doc_dir)
+            import test_doc_scripts
+
+            # The harness spawns the doc scripts itself; they inherit the
+            # lib path from os.environ for the duration of the run
+            existing_py = os.environ.get("PYTHONPATH")
+            os.environ.update(_LIB_ENV_OVERLAY)
+            try:
+                returncode = test_doc_scripts.main()
+            finally:
+                if existing_py:
+                    os.environ["PYTHONPATH"] = existing_py
+                else:
+                    os.environ.pop("PYTHONPATH", None)
 
-        result = subprocess.run(
-            [sys.executable, str(test_file)], cwd=script_dir.parent, env=env
-        )
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Documentation script tests passed")
             return True
         else:
@@ -519,25 +746,40 @@ def run_pre_commit_checks():
     print("\n🔹 Running Pre-commit Checks...")
     print("-" * 60)
 
+    # Prefer the in-process entry point: a separate pre-commit process would
+    # start another interpreter and re-import pre-commit and PyYAML first
     try:
-        # Check if pre-commit is available
-        result = subprocess.run(
-            ["pre-commit", "--version"], capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            print("⚠️  pre-commit not available, skipping code quality checks")
-            return True
-    except FileNotFoundError:
+        from pre_commit.main import main as pre_commit_main
+    except ImportError:
+        pre_commit_main = None
+
+    # Otherwise check if pre-commit is available (PATH lookup, no spawn)
+    if pre_commit_main is None and shutil.which("pre-commit") is None:
         print("⚠️  pre-commit not installed, skipping code quality checks")
         print("   Install with: pip install pre-commit")
         return True
 
     try:
         # Run pre-commit on all files
-        result = subprocess.run(
-            ["pre-commit", "run", "--all-files"], cwd=Path(__file__).parent.parent
-        )
-        if result.returncode == 0:
+        if pre_commit_main is not None:
+            # pre-commit's argparse and error handler report failures by
+            # raising SystemExit; turn that into an exit code like a child's
+            with _working_directory(PROJECT_ROOT):
+                try:
+                    returncode = pre_commit_main(["run", "--all-files"])
+                except SystemExit as e:
+                    if e.code is None or isinstance(e.code, int):
+                        returncode = e.code or 0
+                    else:
+                        print(e.code)
+                        returncode = 1
+        else:
+            returncode = subprocess.run(
+                ["pre-commit", "run", "--all-files"],
+                stdin=subprocess.DEVNULL,
+                cwd=PROJECT_ROOT,
+            ).returncode
+        if returncode == 0:
             print("✅ Pre-commit checks passed")
             return True
         else:
@@ -548,38 +790,32 @@ def run_pre_commit_checks():
         return False
 
 
-def check_dependencies():
-    """Check if required dependencies are available."""
+@functools.lru_cache(maxsize=1)
+def check_dependencies(need=frozenset({"behave", "pre-commit", "pytest"})):
+    """Check if the dependencies of the selected suites are available.
+
+    Availability is looked up with find_spec and shutil.which, so nothing
+    is imported or spawned. need names the optional tools to probe
+    ("behave", "pre-commit", "pytest"); it must be hashable because results
+    are cached.
+    """
     missing_deps = []
 
     # Check behave for BDD tests
-    try:
-        import behave
-    except ImportError:
+    if "behave" in need and importlib.util.find_spec("behave") is None:
         missing_deps.append("behave")
 
-    # Check mock (usually built-in with Python 3.3+)
-    try:
-        from unittest.mock import Mock
-    except ImportError:
-        missing_deps.append("mock")
-
-    # Check pre-commit for code quality
-    try:
-        import subprocess
-
-        result = subprocess.run(
-            ["pre-commit", "--version"], capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            missing_deps.append("pre-commit")
-    except (FileNotFoundError, subprocess.SubprocessError):
+    # Check pre-commit for code quality: run_pre_commit_checks() prefers the
+    # importable package and only falls back to the executable on PATH
+    if (
+        "pre-commit" in need
+        and importlib.util.find_spec("pre_commit") is None
+        and shutil.which("pre-commit") is None
+    ):
         missing_deps.append("pre-commit")
 
     # Check pytest for unit tests (optional)
-    try:
-        import pytest
-    except ImportError:
+    if "pytest" in need and importlib.util.find_spec("pytest") is None:
         print("ℹ️  pytest not available (optional for unit tests)")
 
     if missing_deps:
@@ -595,9 +831,10 @@ def create_requirements_file():
     requirements_content = """# Dome Control System Test Dependencies
 behave>=1.2.6
 mock>=4.0.3
+pytest-xdist>=3.0  # optional: parallel unit tests
 """
 
-    requirements_path = Path(__file__).parent / "requirements.txt"
+    requirements_path = os.path.join(TEST_DIR, "requirements.txt")
     with open(requirements_path, "w") as f:
         f.write(requirements_content)
 
@@ -605,92 +842,164 @@ mock>=4.0.3
     print("   Install test dependencies with: pip install -r test/requirements.txt")
 
 
-def run_behave_tests(args):
-    """Run the behave test suite with specified arguments."""
-    script_dir = Path(__file__).parent
+@functools.lru_cache(maxsize=1)
+def _feature_files():
+    """Return the sorted paths of the .feature files in FEATURES_DIR.
+
+    The directory is scanned once per run; every caller shares the tuple.
+    Raises FileNotFoundError if the directory is missing.
+    """
+    with os.scandir(FEATURES_DIR) as entries:
+        return tuple(
+            sorted(
+                e.path for e in entries if e.name.endswith(".feature") and e.is_file()
+            )
+        )
 
-    # Set environment variables
-    env = os.environ.copy()
-    env["DOME_TEST_MODE"] = args.mode
 
-    # Ensure behave process can import project modules in indi_driver/lib
-    # (some test steps import `config`, `dome`, etc.)
-    lib_path = str(script_dir.parent / "indi_driver" / "lib")
-    existing_py = env.get("PYTHONPATH", "")
-    env["PYTHONPATH"] = lib_path + (os.pathsep + existing_py if existing_py else "")
+def _feature_name(path):
+    """Return the feature name for a path, as accepted by --feature."""
+    return os.path.basename(path)[: -len(".feature")]
+
+
+def _behave_shards(paths, jobs=None):
+    """Split feature files into one shard per spare core, balanced by size.
+
+    Two cores are left for the runner and the other suites unless jobs
+    gives the number of behave processes explicitly. File size
+    stands in for run time: the largest files are placed first, each on
+    the currently lightest shard. Returns None when there is nothing worth
+    splitting.
+    """
+    count = min(len(paths), jobs or (os.cpu_count() or 1) - 2)
+    if count < 2:
+        return None
+
+    shards = [[] for _ in range(count)]
+    loads = [0] * count
+    for size, path in sorted(((os.path.getsize(p), p) for p in paths), reverse=True):
+        lightest = loads.index(min(loads))
+        shards[lightest].append(path)
+        loads[lightest] += size
+    return shards
+
+
+def _features_with_tag(tag):
+    """Return the feature files that mention a single positive tag.
+
+    A file that never contains the tag cannot contribute scenarios, so
+    behave need not parse it. Tag expressions (negation, and/or, lists)
+    return None and are left entirely to behave.
+    """
+    if not _SIMPLE_TAG_RE.match(tag):
+        return None
+
+    needle = ("@" + tag.lstrip("@")).encode()
+    matches = []
+    for path in _feature_files():
+        with open(path, "rb") as f:
+            if needle in f.read():
+                matches.append(path)
+    return matches
+
+
+def _run_behave(cmd, env):
+    """Run one behave command, capturing its output."""
+    return subprocess.run(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        env=env,
+        cwd=os.path.dirname(FEATURES_DIR),
+        capture_output=True,
+        text=True,
+    )
 
-    # Build behave command
-    cmd = ["python", "-m", "behave"]
 
-    # Add feature filter if specified
-    features_root = script_dir / "integration" / "features"
-    if args.feature:
-        feature_path = features_root / f"{args.feature}.feature"
-        if feature_path.exists():
-            cmd.append(str(feature_path))
-        else:
-            available_features = list(features_root.glob("*.feature"))
-            feature_names = [f.stem for f in available_features]
-            print(f"❌ Feature '{args.feature}' not found")
-            print(f"   Available features: {', '.join(feature_names)}")
-            return False
-    else:
-        # Run all features
-        cmd.append(str(features_root))
+def _behave_passed(result):
+    """Decide whether a finished behave run counts as a pass."""
+    # If behave exit code is zero, report success
+    if result.returncode == 0:
+        return True
 
-    # Add tag filter if specified
-    if args.tag:
-        cmd.extend(["--tags", args.tag])
+    # Otherwise, inspect the summary output: accept the run as successful
+    # if there are zero failed steps (cleanup_error can still occur but
+    # all assertions passed). We look for the 'steps' summary line.
+    m = _BEHAVE_SUMMARY_RE.search(result.stdout)
+    if m:
+        failed_steps = int(m.group(2))
+        if failed_steps == 0:
+            # Treat as success (cleanup-only issues may have been reported)
+            print("ℹ️  Behave reported cleanup-only issues; treating as success.")
+            return True
 
-    # Add verbosity options
-    if args.verbose:
-        cmd.append("--verbose")
+    # Otherwise, propagate failure
+    return False
 
-    # Add format options
-    if args.format:
-        cmd.extend(["--format", args.format])
 
-    # Add output file if specified
-    if args.output:
-        cmd.extend(["--outfile", args.output])
+def run_behave_tests(args):
+    """Run the behave test suite with specified arguments.
 
-    # Change to test integration directory for Behave
-    original_cwd = os.getcwd()
-    os.chdir(features_root.parent)
+    A full smoke run splits the feature files into shards that run as
+    concurrent behave processes. Hardware runs, single features, runs
+    writing an --output file and machine-readable formats (json, junit) use
+    one process.
+    """
+    # Set environment variables in one merge over the current environment
+    env = _driver_env_with(DOME_TEST_MODE=args.mode)
 
+    # Add feature filter if specified
+    shards = None
     try:
-        print(f"🚀 Running command: {' '.join(cmd)}")
-        print(f"📁 Working directory: {script_dir}")
+        if args.feature:
+            feature_path = os.path.join(FEATURES_DIR, f"{args.feature}.feature")
+            if os.path.isfile(feature_path):
+                shards = [[feature_path]]
+            else:
+                feature_names = [_feature_name(path) for path in _feature_files()]
+                print(f"❌ Feature '{args.feature}' not found")
+                print(f"   Available features: {', '.join(feature_names)}")
+                return False
+        else:
+            # Run all features, or only the files that can match a simple --tag
+            tagged = _features_with_tag(args.tag) if args.tag else None
+            if (
+                args.mode != "hardware"
+                and not args.output
+                and args.format not in _MACHINE_FORMATS
+            ):
+                shards = _behave_shards(tagged or _feature_files(), args.jobs)
+            if not shards:
+                shards = [tagged or [FEATURES_DIR]]
+    except FileNotFoundError:
+        print(f"❌ Features directory not found: {FEATURES_DIR}")
+        return False
+
+    options = [arg for option in _BEHAVE_OPTIONS for arg in option(args)]
+    commands = [[*BEHAVE_CMD, *shard, *options] for shard in shards]
+
+    try:
+        for cmd in commands:
+            print(f"🚀 Running command: {' '.join(cmd)}")
+        print(f"📁 Working directory: {os.path.dirname(FEATURES_DIR)}")
         print(f"🔧 Test mode: {args.mode.upper()}")
         print("-" * 60)
 
         # Run behave and capture output so we can be tolerant of cleanup-only errors
-        result = subprocess.run(cmd, env=env, capture_output=True, text=True)
-        # Print behave output for user visibility
-        print(result.stdout)
-        if result.stderr:
-            print("BEHAVE STDERR:")
-            print(result.stderr)
-
-        # If behave exit code is zero, report success
-        if result.returncode == 0:
-            return True
-
-        # Otherwise, inspect the summary output: accept the run as successful
-        # if there are zero failed steps (cleanup_error can still occur but
-        # all assertions passed). We look for the 'steps' summary line.
-        import re
-
-        m = re.search(r"(\d+) steps passed,\s*(\d+) failed", result.stdout)
-        if m:
-            failed_steps = int(m.group(2))
-            if failed_steps == 0:
-                # Treat as success (cleanup-only issues may have been reported)
-                print("ℹ️  Behave reported cleanup-only issues; treating as success.")
-                return True
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            results = list(
+                executor.map(functools.partial(_run_behave, env=env), commands)
+            )
 
-        # Otherwise, propagate failure
-        return False
+        passed = True
+        for i, result in enumerate(results):
+            # Print behave output for user visibility, tagged by shard
+            prefix = f"[W{i}] " if len(results) > 1 else ""
+            print("".join(prefix + line for line in result.stdout.splitlines(True)))
+            if result.stderr:
+                print(f"{prefix}BEHAVE STDERR:")
+                print(result.stderr)
+            passed = _behave_passed(result) and passed
+        return passed
 
     except FileNotFoundError:
         print("❌ behave not found. Install with: pip install behave")
@@ -698,42 +1007,122 @@ def run_behave_tests(args):
     except KeyboardInterrupt:
         print("\n⏹️  Tests interrupted by user")
         return False
-    finally:
-        os.chdir(original_cwd)
+
+
+def _feature_description(path):
+    """Return the description on a feature file's "Feature:" first line.
+
+    Returns None when the file does not start with one or cannot be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            first_line = f.readline(256).strip()
+    except OSError:
+        return None
+    if not first_line.startswith(b"Feature:"):
+        return None
+    return first_line[8:].strip().decode("utf-8", "replace")
 
 
 def list_features():
     """List available test features."""
-    script_dir = Path(__file__).parent
-    features_dir = script_dir / "integration" / "features"
-
-    if not features_dir.exists():
+    try:
+        features = _feature_files()
+    except FileNotFoundError:
         print("❌ Features directory not found")
         return
 
-    features = list(features_dir.glob("*.feature"))
     if not features:
         print("❌ No feature files found")
         return
 
     print("📋 Available test features:")
-    for feature in sorted(features):
-        print(f"   • {feature.stem}")
+    for feature in features:
+        print(f"   • {_feature_name(feature)}")
 
-        # Try to read feature description
-        try:
-            with open(feature, "r") as f:
-                first_line = f.readline().strip()
-                if first_line.startswith("Feature:"):
-                    description = first_line[8:].strip()
-                    print(f"     {description}")
-        except Exception:
-            pass
+        # Show the feature description when the file starts with one
+        description = _feature_description(feature)
+        if description:
+            print(f"     {description}")
         print()
 
 
-def main():
-    """Main entry point."""
+class _SuiteOutput:
+    """Stdout proxy that buffers writes made by suite worker threads.
+
+    Each worker registers its own buffer, so concurrently running suites do
+    not interleave their progress lines; writes from other threads pass
+    straight through to the real stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, name, runner):
+        """Run a suite with this thread's output buffered; return both."""
+        self._local.buffer = io.StringIO()
+        try:
+            result = runner()
+        except Exception as e:
+            print(f"❌ Error running {name} suite: {e}")
+            result = False
+        finally:
+            output = self._local.buffer.getvalue()
+            del self._local.buffer
+        return result, output
+
+    def buffering(self):
+        """Return True if the calling thread's writes are being buffered."""
+        return hasattr(self._local, "buffer")
+
+    def write(self, text):
+        return getattr(self._local, "buffer", self._stream).write(text)
+
+    def flush(self):
+        getattr(self._local, "buffer", self._stream).flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _run_suites(jobs, parallel, fail_fast=False):
+    """Run the selected suites, concurrently when it is safe to do so.
+
+    Every suite only waits on its own child processes, so in smoke mode they
+    run on a thread pool and each suite's buffered report is printed, every
+    line prefixed with the suite name, as soon as it completes. Results keep
+    the selection order for the summary; with fail_fast, serial runs stop at
+    the first failure and the suites after it are left as None (skipped).
+    """
+    results = dict.fromkeys(jobs)
+    if not parallel or len(jobs) < 2:
+        for name, runner in jobs.items():
+            results[name] = runner()
+            if fail_fast and not results[name]:
+                break
+        return results
+
+    output = _SuiteOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {
+                executor.submit(output.capture, name, runner): name
+                for name, runner in jobs.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                results[name], report = future.result()
+                prefix = f"[{name}] "
+                output.write("".join(prefix + line for line in report.splitlines(True)))
+    finally:
+        sys.stdout = output._stream
+    return results
+
+
+def _build_parser():
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(
         description="Dome Control System Comprehensive Test Runner",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -753,6 +1142,7 @@ Examples:
   python run_tests.py --mode hardware     # Run hardware tests (CAUTION!)
   python run_tests.py --feature rotation  # Run specific BDD feature
   python run_tests.py --tag @smoke        # Run smoke-tagged BDD tests
+  python run_tests.py --bdd-only -j 4     # Split BDD features over 4 processes
 
 Test Modes (for BDD tests):
   smoke    - Safe mode with no real hardware operations (default)
@@ -763,6 +1153,9 @@ Notes:
   - Hardware mode requires proper dome setup and safety precautions
   - Use --all for complete validation before commits/releases
   - Doc script tests ensure documentation examples work correctly
+  - Hardware (serial) runs stop at the first failing suite unless --all or
+    --no-fail-fast is given; smoke runs start every suite at once, so there
+    a failure only skips the pre-commit checks
         """,
     )
 
@@ -801,8 +1194,7 @@ Notes:
     # BDD test options
     parser.add_argument(
         "--mode",
-        choices=["smoke", "hardware"],
-        default="smoke",
+        choices=_MODE_CHOICES,
         help="BDD test mode: smoke (safe, no hardware) or hardware (real operations)",
     )
 
@@ -814,14 +1206,37 @@ Notes:
         "--tag", help="Run BDD tests with specific tag (e.g., @smoke, @critical)"
     )
 
+    parser.add_argument(
+        "--no-fail-fast",
+        action="store_true",
+        help="Keep running the remaining suites after one fails (implied by "
+        "--all). Applies to serial hardware runs; parallel smoke runs always "
+        "finish every suite and only skip pre-commit after a failure",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        metavar="N",
+        help="Number of concurrent behave processes (default: CPU count - 2; "
+        "1 disables sharding)",
+    )
+
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run in-process suites (doc scripts) in a separate interpreter "
+        "(always the case when they run alongside other suites)",
+    )
+
     # Output options
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     parser.add_argument(
         "--format",
-        choices=["pretty", "plain", "json", "junit"],
-        default="pretty",
-        help="BDD output format",
+        choices=_FORMAT_CHOICES,
+        help="BDD output format (default: progress2, or pretty with --verbose)",
     )
 
     parser.add_argument("--output", "-o", help="Output file for BDD test results")
@@ -845,8 +1260,22 @@ Notes:
         help="Assume yes for interactive prompts (useful for CI/automation)",
     )
 
-    args = parser.parse_args()
+    parser.set_defaults(**_DEFAULT_OPTIONS)
+    return parser
+
+
+def main():
+    """Main entry point."""
+    # A bare invocation needs no parsing; skip building the full parser
+    if len(sys.argv) == 1:
+        args = argparse.Namespace(**_DEFAULT_OPTIONS)
+    else:
+        args = _build_parser().parse_args()
+    _run_main(args)
+
 
+def _run_main(args):
+    """Run the suites selected by the parsed command line."""
     # Handle special commands
     if args.list_features:
         list_features()
@@ -861,13 +1290,6 @@ Notes:
         success = run_hardware_startup_sequence()
         sys.exit(0 if success else 1)
 
-    # Check dependencies
-    if not check_dependencies():
-        print("\n💡 To install test dependencies:")
-        print("   pip install behave mock pre-commit")
-        print("   Or run: python run_tests.py --install-deps")
-        sys.exit(1)
-
     # Determine which tests to run
     run_integration = True
     run_unit = True
@@ -888,6 +1310,20 @@ Notes:
     elif args.all:
         run_precommit = True
 
+    # Check dependencies, probing only what the selected suites use
+    need = set()
+    if run_unit:
+        need.add("pytest")
+    if run_bdd:
+        need.add("behave")
+    if run_precommit:
+        need.add("pre-commit")
+    if not check_dependencies(frozenset(need)):
+        print("\n💡 To install test dependencies:")
+        print("   pip install behave mock pre-commit")
+        print("   Or run: python run_tests.py --install-deps")
+        sys.exit(1)
+
     # Safety warning for hardware mode
     if run_bdd and args.mode == "hardware":
         print("⚠️  " + "=" * 70)
@@ -923,33 +1359,40 @@ Notes:
     print("🔭 DOME CONTROL SYSTEM - COMPREHENSIVE TEST SUITE")
     print("=" * 80)
 
-    success = True
-    results = {}
+    # Suites only touch their own subprocesses, so smoke runs overlap them;
+    # hardware runs stay serial because they share the physical dome.
+    parallel = (
+        args.mode == "smoke"
+        and os.environ.get("DOME_TEST_MODE", "smoke").lower() != "hardware"
+    )
+    # The in-process doc harness changes os.environ and sys.path, which the
+    # other suites' threads would see; alongside them it runs as a child
+    isolate_docs = args.isolate or (
+        parallel and (run_integration or run_unit or run_bdd)
+    )
 
-    # Run integration tests
+    jobs = {}
     if run_integration:
-        results["integration"] = run_integration_tests()
-        success = success and results["integration"]
-
-    # Run unit tests
+        jobs["integration"] = run_integration_tests
     if run_unit:
-        results["unit"] = run_unit_tests()
-        success = success and results["unit"]
-
-    # Run doc script tests
+        jobs["unit"] = run_unit_tests
     if run_doc_scripts:
-        results["doc_scripts"] = run_doc_script_tests()
-        success = success and results["doc_scripts"]
-
-    # Run BDD tests
+        jobs["doc_scripts"] = lambda: run_doc_script_tests(isolate_docs)
     if run_bdd:
-        results["bdd"] = run_behave_tests(args)
-        success = success and results["bdd"]
+        jobs["bdd"] = lambda: run_behave_tests(args)
 
-    # Run pre-commit checks
+    # Stop at the first failing suite unless a complete report was asked for
+    fail_fast = not (args.all or args.no_fail_fast)
+    results = _run_suites(jobs, parallel, fail_fast)
+
+    # Run pre-commit checks last; hooks may rewrite files the suites read
     if run_precommit:
-        results["precommit"] = run_pre_commit_checks()
-        success = success and results["precommit"]
+        if fail_fast and not all(results.values()):
+            results["precommit"] = None
+        else:
+            results["precommit"] = run_pre_commit_checks()
+
+    success = all(results.values())
 
     # Print summary
     print("\n" + "=" * 80)
@@ -957,14 +1400,11 @@ Notes:
     print("=" * 80)
 
     for test_name, result in results.items():
-        status = "✅ PASSED" if result else "❌ FAILED"
-        test_display = {
-            "integration": "Integration Tests",
-            "unit": "Unit Tests",
-            "doc_scripts": "Documentation Script Tests",
-            "bdd": "BDD Tests",
-            "precommit": "Pre-commit Checks",
-        }.get(test_name, test_name)
+        if result is None:
+            status = "⏭️  SKIPPED"
+        else:
+            status = "✅ PASSED" if result else "❌ FAILED"
+        test_display = _TEST_DISPLAY.get(test_name, test_name)
         print(f"{test_display:.<40} {status}")
 
     if success:
@@ -977,6 +1417,10 @@ Notes:
     else:
         print("\n❌ SOME TESTS FAILED")
         print("   Review the output above for details")
+        if None in results.values():
+            print(
+                "💡 Stopped at the first failure; use --no-fail-fast to run every suite"
+            )
         sys.exit(1)
 
 